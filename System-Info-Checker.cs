@@ -6,32 +6,230 @@ using System.Text;
 using System.Globalization;
 using System.IO;
 using System.Runtime.InteropServices;
-using System.Diagnostics;
+using System.Threading.Tasks;
 
 class Program
 {
-    static void Main()
+    // Single WMI connection shared by every query, rather than letting each
+    // searcher open (and initialize COM for) its own session.
+    static readonly ManagementScope WmiScope = new(@"\\.\root\cimv2");
+
+    // Results are read once, in order, so a non-rewindable enumerator lets WMI
+    // stream them instead of keeping a copy of every returned object.
+    static readonly System.Management.EnumerationOptions ForwardOnly = new()
+    {
+        Rewindable = false
+    };
+
+    // Report sections, in output order. Reusable sections describe the OS
+    // install, firmware, CPU and memory, which only change across a power cycle,
+    // so they may be carried over from an earlier run. The others (removable
+    // disks, GPU drivers, updates, network addresses, locale, what's on the
+    // PATH) can change at any time and are collected every run.
+    static readonly (string Title, Action<StringBuilder> Print, bool Reusable)[] Sections =
+    {
+        ("System Summary", PrintSystemSummary, true),
+        ("Hardware Resources", PrintHardwareResources, true),
+        ("Components", PrintComponents, false),
+        ("Software Environment", PrintSoftwareEnvironment, false),
+        ("Locale and Encoding", PrintLocaleAndEncodingInfo, false),
+        ("Installed Programming Languages", PrintInstalledProgrammingLanguages, false)
+    };
+
+    // Each entry: (Name, list of executables that might indicate it's installed)
+    static readonly (string Name, string[] Candidates)[] Languages =
+    {
+        ("C", new []{"cl.exe","gcc.exe","clang.exe"}),
+        ("C++", new []{"cl.exe","g++.exe","clang++.exe"}),
+        ("C#", new []{"csc.exe"}),
+        ("Java", new []{"java.exe","javac.exe"}),
+        ("Go", new []{"go.exe"}),
+        ("Rust", new []{"rustc.exe","cargo.exe"}),
+        ("Python", new []{"python.exe","python3.exe"}),
+        ("Perl", new []{"perl.exe"}),
+        ("PHP", new []{"php.exe"}),
+        ("Ruby", new []{"ruby.exe"}),
+        ("Node.js", new []{"node.exe"}),
+        ("R", new []{"R.exe"}),
+        ("Haskell (GHC)", new []{"ghc.exe","ghci.exe"}),
+        ("Swift", new []{"swift.exe"})
+    };
+
+    // Directories to search, in 'where' order: current directory first, then PATH
+    static readonly List<string> SearchDirs = BuildSearchDirs();
+
+    const string OutputFile = "system_info.txt";
+
+    // Reusable sections are cached per user and machine, not read back from
+    // system_info.txt, which may sit on a share or USB stick or be copied in
+    // from another computer.
+    static readonly string CacheFile = Path.Combine(
+        Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData),
+        "System-Info-Checker", "hardware_cache.txt");
+
+    static void Main(string[] args)
     {
         // Only run on Windows
         if (!RuntimeInformation.IsOSPlatform(OSPlatform.Windows))
             return;
 
-        StringBuilder output = new StringBuilder();
-        
-        PrintSystemSummary(output);
-        PrintHardwareResources(output);
-        PrintComponents(output);
-        PrintSoftwareEnvironment(output);
-        PrintLocaleAndEncodingInfo(output);
-        PrintInstalledProgrammingLanguages(output);
+        // Carry the hardware sections over from a run since this machine last
+        // powered on, unless --refresh is given
+        bool refresh = Array.Exists(args, a => string.Equals(a, "--refresh", StringComparison.OrdinalIgnoreCase));
+        string[]? cached = refresh ? null : LoadCachedSections();
+
+        // The sections are independent and spend most of their time waiting on
+        // WMI or the file system, so run them concurrently, each into its own
+        // buffer, and write the buffers out in report order.
+        var buffers = new StringBuilder[Sections.Length];
+        var tasks = new List<Task>();
+        for (int i = 0; i < Sections.Length; i++)
+        {
+            int index = i;
+            var (title, print, reusable) = Sections[index];
+            if (cached != null && reusable)
+            {
+                buffers[index] = new StringBuilder(cached[index]);
+                continue;
+            }
+
+            buffers[index] = new StringBuilder();
+            tasks.Add(Task.Run(() =>
+            {
+                PrintSectionHeader(buffers[index], title);
+                print(buffers[index]);
+            }));
+        }
+        Task.WaitAll(tasks.ToArray());
+
+        // Stream the section buffers straight to the file rather than joining
+        // them into one more StringBuilder and a full-report string first.
+        using (var writer = new StreamWriter(OutputFile, append: false))
+        {
+            foreach (var buffer in buffers)
+                writer.Write(buffer.ToString());
+        }
+
+        if (cached != null)
+            Console.WriteLine("Hardware details were reused from an earlier run on this machine; run with --refresh to collect them again.");
+        else
+            SaveCachedSections(buffers);
+    }
+
+    [DllImport("kernel32.dll")]
+    static extern ulong GetTickCount64();
+
+    [DllImport("powrprof.dll")]
+    static extern uint CallNtPowerInformation(
+        int informationLevel, IntPtr inputBuffer, uint inputBufferLength,
+        out ulong outputBuffer, uint outputBufferLength);
+
+    const int LastWakeTime = 14; // POWER_INFORMATION_LEVEL
+
+    /// <summary>
+    /// Returns when the machine last booted or resumed from sleep/hibernation,
+    /// whichever is later, or null if that can't be determined. The boot time
+    /// alone isn't enough: a Fast Startup "Shut down" is a hibernation, so the
+    /// tick count keeps running across it.
+    /// </summary>
+    static DateTime? LastPowerOnUtc()
+    {
+        var bootTime = DateTime.UtcNow - TimeSpan.FromMilliseconds(GetTickCount64());
+
+        // Interrupt time of the last resume, in 100 ns units since boot (0 if none)
+        if (CallNtPowerInformation(LastWakeTime, IntPtr.Zero, 0, out ulong wakeTime, sizeof(ulong)) != 0)
+            return null;
+
+        return bootTime + TimeSpan.FromTicks((long)wakeTime);
+    }
+
+    // First line of the cache, identifying the machine that wrote it
+    static string CacheMarker() => $"Machine: {Environment.MachineName}{Environment.NewLine}";
+
+    /// <summary>
+    /// Returns the cached text of each reusable section (indexed like Sections,
+    /// null for the others) if the cache was written on this machine after it
+    /// last powered on and none of the cached queries failed. Returns null otherwise.
+    /// </summary>
+    static string[]? LoadCachedSections()
+    {
+        if (!File.Exists(CacheFile))
+            return null;
+
+        var poweredOn = LastPowerOnUtc();
+        if (poweredOn == null || File.GetLastWriteTimeUtc(CacheFile) <= poweredOn)
+            return null;
+
+        string cache;
+        try
+        {
+            cache = File.ReadAllText(CacheFile);
+        }
+        catch
+        {
+            return null;
+        }
+
+        var marker = CacheMarker();
+        if (!cache.StartsWith(marker, StringComparison.Ordinal))
+            return null;
+
+        // Each reusable section starts at its header; all of them must be present, in order
+        var reusable = new List<int>();
+        var starts = new List<int>();
+        int from = marker.Length;
+        for (int i = 0; i < Sections.Length; i++)
+        {
+            if (!Sections[i].Reusable)
+                continue;
+
+            int at = cache.IndexOf(SectionHeader(Sections[i].Title), from, StringComparison.Ordinal);
+            if (at < 0)
+                return null;
+            reusable.Add(i);
+            starts.Add(at);
+            from = at + 1;
+        }
+
+        var sections = new string[Sections.Length];
+        for (int n = 0; n < reusable.Count; n++)
+        {
+            int end = n + 1 < starts.Count ? starts[n + 1] : cache.Length;
+            var text = cache.Substring(starts[n], end - starts[n]);
+
+            // A failed query (e.g. WMI still starting just after boot) must not be carried over
+            if (text.Contains("Error querying"))
+                return null;
+
+            sections[reusable[n]] = text;
+        }
+        return sections;
+    }
 
-        File.WriteAllText("system_info.txt", output.ToString());
+    /// <summary>
+    /// Writes the reusable sections of a fresh report to the cache for later runs.
+    /// </summary>
+    static void SaveCachedSections(StringBuilder[] buffers)
+    {
+        try
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(CacheFile)!);
+            using var writer = new StreamWriter(CacheFile, append: false);
+            writer.Write(CacheMarker());
+            for (int i = 0; i < Sections.Length; i++)
+            {
+                if (Sections[i].Reusable)
+                    writer.Write(buffers[i].ToString());
+            }
+        }
+        catch
+        {
+            // Without a cache the next run simply collects everything again
+        }
     }
 
     static void PrintSystemSummary(StringBuilder sb)
     {
-        PrintSectionHeader(sb, "System Summary");
-        
         // OS Information
         QueryWMI(sb, "Win32_OperatingSystem", new List<WmiProperty> {
             new("Caption", "OS Name"),
@@ -61,8 +259,6 @@ class Program
 
     static void PrintHardwareResources(StringBuilder sb)
     {
-        PrintSectionHeader(sb, "Hardware Resources");
-        
         // Memory
         QueryWMI(sb, "Win32_PhysicalMemory", new List<WmiProperty> {
             new("Capacity", "Memory Capacity (GB)", v => $"{Convert.ToUInt64(v) / (1024 * 1024 * 1024):N1}"),
@@ -83,8 +279,6 @@ class Program
 
     static void PrintComponents(StringBuilder sb)
     {
-        PrintSectionHeader(sb, "Components");
-        
         // Graphics
         QueryWMI(sb, "Win32_VideoController", new List<WmiProperty> {
             new("Name", "Adapter"),
@@ -103,8 +297,6 @@ class Program
 
     static void PrintSoftwareEnvironment(StringBuilder sb)
     {
-        PrintSectionHeader(sb, "Software Environment");
-        
         // Installed Updates
         QueryWMI(sb, "Win32_QuickFixEngineering", new List<WmiProperty> {
             new("HotFixID", "Update"),
@@ -122,51 +314,28 @@ class Program
 
     static void PrintLocaleAndEncodingInfo(StringBuilder sb)
     {
-        PrintSectionHeader(sb, "Locale and Encoding");
         sb.AppendLine($"System Locale: {CultureInfo.CurrentCulture.Name}");
         sb.AppendLine($"Default Encoding: {Encoding.Default.EncodingName}");
     }
 
     /// <summary>
     /// Checks for commonly used programming languages by trying to locate 
-    /// their main executable(s) with the 'where' command in Windows.
+    /// their main executable(s) in the current directory and on the PATH,
+    /// the same places the Windows 'where' command looks.
     /// Only prints the ones that are actually found.
     /// </summary>
     static void PrintInstalledProgrammingLanguages(StringBuilder sb)
     {
-        PrintSectionHeader(sb, "Installed Programming Languages");
+        var locations = FindExecutables(Languages, SearchDirs);
 
-        // Each entry: (Name, list of executables that might indicate it's installed)
-        var languages = new (string Name, string[] Candidates)[]
-        {
-            ("C", new []{"cl.exe","gcc.exe","clang.exe"}),
-            ("C++", new []{"cl.exe","g++.exe","clang++.exe"}),
-            ("C#", new []{"csc.exe"}),
-            ("Java", new []{"java.exe","javac.exe"}),
-            ("Go", new []{"go.exe"}),
-            ("Rust", new []{"rustc.exe","cargo.exe"}),
-            ("Python", new []{"python.exe","python3.exe"}),
-            ("Perl", new []{"perl.exe"}),
-            ("PHP", new []{"php.exe"}),
-            ("Ruby", new []{"ruby.exe"}),
-            ("Node.js", new []{"node.exe"}),
-            ("R", new []{"R.exe"}),
-            ("Haskell (GHC)", new []{"ghc.exe","ghci.exe"}),
-            ("Swift", new []{"swift.exe"})
-        };
-
-        // For each language in the above list, see if at least one candidate is found
-        foreach (var (name, executables) in languages)
+        // For each language in the Languages table, see if at least one candidate is found
+        foreach (var (name, executables) in Languages)
         {
             // We'll store all found paths, then print them.
             List<string> foundPaths = new();
 
             foreach (var exe in executables)
-            {
-                var paths = WhereCommand(exe);
-                if (paths != null && paths.Count > 0)
-                    foundPaths.AddRange(paths);
-            }
+                foundPaths.AddRange(locations[exe]);
 
             if (foundPaths.Count > 0)
             {
@@ -179,43 +348,65 @@ class Program
     }
 
     /// <summary>
-    /// Runs the 'where' command for a given executable name. 
-    /// Returns a list of full paths if found, or null/empty if not found.
+    /// Looks for every candidate executable in a single pass over the search
+    /// directories, without spawning 'where.exe'. Executables shared by several
+    /// languages (e.g. cl.exe) are only probed once. Returns, for each
+    /// executable name, the full paths of every match in search order.
     /// </summary>
-    private static List<string>? WhereCommand(string exeName)
+    private static Dictionary<string, List<string>> FindExecutables(
+        (string Name, string[] Candidates)[] languages,
+        List<string> searchDirs)
     {
-        try
-        {
-            var psi = new ProcessStartInfo("where", exeName)
-            {
-                UseShellExecute = false,
-                RedirectStandardOutput = true,
-                RedirectStandardError = true,
-                CreateNoWindow = true
-            };
+        var found = new Dictionary<string, List<string>>(StringComparer.OrdinalIgnoreCase);
+        foreach (var (_, executables) in languages)
+            foreach (var exe in executables)
+                if (!found.ContainsKey(exe))
+                    found[exe] = new List<string>();
 
-            using var proc = Process.Start(psi);
-            proc.WaitForExit();
+        foreach (var dir in searchDirs)
+        {
+            // Stale PATH entries cost one check here rather than one per executable
+            if (!Directory.Exists(dir))
+                continue;
 
-            if (proc.ExitCode == 0) // Found
+            foreach (var entry in found)
             {
-                var output = proc.StandardOutput.ReadToEnd();
-                // 'where' can return multiple lines if the exe is in multiple places
-                var lines = output.Split(new[] { '\r', '\n' }, StringSplitOptions.RemoveEmptyEntries);
-                return new List<string>(lines);
+                try
+                {
+                    // Relative PATH entries are resolved, as 'where' reports absolute paths
+                    var candidate = Path.GetFullPath(Path.Combine(dir, entry.Key));
+                    if (File.Exists(candidate))
+                        entry.Value.Add(candidate);
+                }
+                catch
+                {
+                    // Malformed PATH entries (invalid characters etc.) are just skipped
+                }
             }
         }
-        catch
+        return found;
+    }
+
+    static List<string> BuildSearchDirs()
+    {
+        var dirs = new List<string> { Directory.GetCurrentDirectory() };
+        var pathVar = Environment.GetEnvironmentVariable("PATH") ?? "";
+        foreach (var entry in pathVar.Split(new[] { ';' }, StringSplitOptions.RemoveEmptyEntries))
         {
-            // If there's an error (shouldn't typically happen), just ignore
+            var dir = entry.Trim().Trim('"');
+            if (dir.Length > 0)
+                dirs.Add(dir);
         }
-        return null;
+        return dirs;
     }
 
+    // The blank line and banner that open each section, as written to the report
+    static string SectionHeader(string title) =>
+        $"{Environment.NewLine}===== {title.ToUpper()} ====={Environment.NewLine}";
+
     static void PrintSectionHeader(StringBuilder sb, string title)
     {
-        sb.AppendLine();
-        sb.AppendLine($"===== {title.ToUpper()} =====");
+        sb.Append(SectionHeader(title));
         sb.AppendLine();
     }
 
@@ -238,11 +429,21 @@ class Program
             if (sectionTitle != null)
                 PrintSubSectionHeader(sb, sectionTitle);
 
-            var query = $"SELECT * FROM {className}";
+            // Ask only for the properties we print; SELECT * makes WMI
+            // populate and marshal every property of every instance.
+            var columns = string.Join(", ", properties.ConvertAll(p => p.PropertyName));
+            var query = $"SELECT {columns} FROM {className}";
             if (!string.IsNullOrEmpty(condition))
                 query += $" WHERE {condition}";
 
-            using var searcher = new ManagementObjectSearcher(query);
+            // Sections run concurrently; only the first query opens the connection
+            lock (WmiScope)
+            {
+                if (!WmiScope.IsConnected)
+                    WmiScope.Connect();
+            }
+
+            using var searcher = new ManagementObjectSearcher(WmiScope, new ObjectQuery(query), ForwardOnly);
             foreach (ManagementObject obj in searcher.Get())
             {
                 foreach (var prop in properties)